@@ -1,10 +1,22 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, Float, JSON, LargeBinary, Date
+from sqlalchemy import BigInteger, Column, Index, Integer, String, DateTime, Text, Boolean, ForeignKey, Float, JSON, LargeBinary, Date
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone
+from sqlalchemy.sql import func
+
+import xxhash
 
 from app.database.connection import Base
 
 
+def fen_hash(fen: str) -> int:
+    """64-bit hash of a FEN string for indexed position lookups
+
+    Masked to 63 bits so the value fits a signed Postgres BIGINT.
+    Lookups should pair it with an equality check on the fen column to
+    guard against hash collisions: WHERE fen_hash = ? AND fen = ?
+    """
+    return xxhash.xxh64_intdigest(fen.encode("ascii")) & 0x7FFFFFFFFFFFFFFF
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -15,7 +27,7 @@ class User(Base):
     subscription_tier = Column(String, default="free")  # free, pro
     is_active = Column(Boolean, default=True)
     is_admin = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, server_default=func.now())
     last_login = Column(DateTime, nullable=True)
 
     # Relationships
@@ -31,9 +43,9 @@ class Game(Base):
 
     # PGN and move data
     pgn = Column(Text, nullable=False)  # Full PGN text
-    moves_san = Column(JSON, nullable=True)  # SAN moves: ["e4", "e5", "Nf3", ...]
-    moves_uci = Column(JSON, nullable=True)  # UCI moves: ["e2e4", "e7e5", "g1f3", ...]
-    moves_binary = Column(LargeBinary, nullable=True)  # Binary encoding (future optimization)
+    moves_san = Column(JSON, nullable=True)  # Legacy; no longer written by imports
+    moves_uci = Column(JSON, nullable=True)  # Legacy; no longer written by imports
+    moves_binary = Column(LargeBinary, nullable=True)  # Packed uint16 moves; see app.services.pgn.encode_moves
 
     # Game metadata
     event = Column(String, nullable=True, index=True)  # Tournament/event name
@@ -64,20 +76,28 @@ class Game(Base):
     termination = Column(String, nullable=True)  # Normal, Time forfeit, etc.
 
     # Timestamps
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, server_default=func.now(), index=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     user = relationship("User", back_populates="games")
     positions = relationship("Position", back_populates="game", cascade="all, delete-orphan")
 
+    # Composite index matching the pagination query
+    # (WHERE user_id = ? ORDER BY created_at DESC), so the planner can
+    # serve filter and sort from one index range scan
+    __table_args__ = (
+        Index("ix_games_user_created", "user_id", created_at.desc(), id.desc()),
+    )
+
 
 class Position(Base):
     __tablename__ = "positions"
 
     id = Column(Integer, primary_key=True, index=True)
     game_id = Column(Integer, ForeignKey("games.id"), nullable=False)
-    fen = Column(String, index=True, nullable=False)
+    fen = Column(String, nullable=False)
+    fen_hash = Column(BigInteger, index=True, nullable=True)  # fen_hash(fen); narrow replacement for the old String index
     move_number = Column(Integer, nullable=False)
     side_to_move = Column(String, nullable=False)  # white, black
 
@@ -91,7 +111,7 @@ class Position(Base):
     concepts_detected = Column(JSON, nullable=True)  # List of concept IDs
     difficulty_level = Column(String, nullable=True)  # beginner, intermediate, advanced
 
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, server_default=func.now())
 
     # Relationships
     game = relationship("Game", back_populates="positions")
@@ -132,8 +152,9 @@ class ExplanationCache(Base):
     __tablename__ = "explanation_cache"
 
     id = Column(Integer, primary_key=True, index=True)
-    fen = Column(String, index=True, nullable=False)
+    fen = Column(String, nullable=False)
+    fen_hash = Column(BigInteger, index=True, nullable=True)  # fen_hash(fen); narrow replacement for the old String index
     user_rating_range = Column(String, nullable=False)  # "1000-1200", "1200-1400"
     explanation = Column(Text, nullable=False)
     ai_model_used = Column(String, nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, server_default=func.now())
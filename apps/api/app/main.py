@@ -1,12 +1,21 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+
+import orjson
+from fastapi import Depends, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from strawberry.fastapi import GraphQLRouter
-import logging
 
 from app.core.config import settings
 from app.schemas.schema import schema
+from app.schemas.loaders import create_analysis_loader, create_game_list_loader
 from app.services.engine import get_engine_service, shutdown_engine_service
-from app.database.connection import SessionLocal
+from app.services.explanations import explanation_cache_service
+from app.database.connection import AsyncSessionLocal, async_engine, get_async_db
+from app.database.models import Concept
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +23,46 @@ app = FastAPI(
     title="Elucidate Chess API",
     description="AI-powered chess analysis and learning platform",
     version="0.1.0",
+    # orjson renders responses several times faster than the stdlib
+    # json encoder used by the default JSONResponse
+    default_response_class=ORJSONResponse,
 )
 
+# Reference data preloaded at startup (id -> Concept row attributes)
+concepts_by_id: dict = {}
+
+
+async def warm_connection_pool():
+    """Check out and ping every pooled connection once
+
+    Forces the TCP/TLS/auth handshake for the whole pool at startup so
+    the first user requests don't pay it. All connections are held open
+    together so each checkout really opens a new one.
+    """
+    connections = await asyncio.gather(
+        *(async_engine.connect() for _ in range(settings.db_pool_size))
+    )
+    try:
+        await asyncio.gather(
+            *(conn.execute(text("SELECT 1")) for conn in connections)
+        )
+    finally:
+        await asyncio.gather(*(conn.close() for conn in connections))
+
+
+async def preload_concepts():
+    """Load the (small, static) concepts table into memory"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(Concept))
+        for concept in result.scalars():
+            concepts_by_id[concept.id] = {
+                "id": concept.id,
+                "name": concept.name,
+                "category": concept.category,
+                "difficulty": concept.difficulty,
+                "description": concept.description,
+            }
+
 
 # Application lifecycle events
 @app.on_event("startup")
@@ -30,12 +77,24 @@ async def startup_event():
         logger.error(f"Failed to start engine: {e}")
         # Continue anyway - engine will be started on first request
 
+    try:
+        await warm_connection_pool()
+        await preload_concepts()
+        logger.info(
+            f"Database pool warmed ({settings.db_pool_size} connections), "
+            f"{len(concepts_by_id)} concepts preloaded"
+        )
+    except Exception as e:
+        logger.error(f"Failed to warm database pool: {e}")
+        # Continue anyway - connections will be opened on first request
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup services on application shutdown"""
     logger.info("Shutting down Elucidate Chess API...")
     await shutdown_engine_service()
+    await explanation_cache_service.close()
     logger.info("Engine stopped successfully")
 
 # CORS middleware
@@ -48,23 +107,35 @@ app.add_middleware(
 )
 
 # Health check endpoint
+# Serialized once at import: liveness probes hit this every few seconds
+# and the payload never changes within a process
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "elucidate-chess",
+    "version": "1.0.0",
+    "environment": settings.environment
+})
+
+
 @app.get("/chess/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "service": "elucidate-chess",
-        "version": "1.0.0",
-        "environment": settings.environment
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 # GraphQL endpoint
-def get_context():
-    """Provide context for GraphQL requests"""
-    db = SessionLocal()
-    try:
-        return {"db": db}
-    finally:
-        db.close()
+async def get_context(db: AsyncSession = Depends(get_async_db)):
+    """Provide context for GraphQL requests
+
+    The async session comes from the shared asyncpg pool via the
+    get_async_db dependency, so resolvers receive an already-checked-out
+    connection and their DB I/O yields cooperatively to the event loop.
+    """
+    return {
+        "db": db,
+        "concepts_by_id": concepts_by_id,
+        "game_list_loader": create_game_list_loader(db),
+        "analysis_loader": create_analysis_loader(),
+        "explanation_cache": explanation_cache_service,
+    }
 
 graphql_app = GraphQLRouter(schema, context_getter=get_context)
 app.include_router(graphql_app, prefix="/chess/graphql")
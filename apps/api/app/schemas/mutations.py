@@ -1,16 +1,20 @@
 import strawberry
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.schemas.types import UserType, GameType, PGNImportResult
+from app.schemas.types import UserType, GameType, PGNImportResult, game_row_to_type
 from app.database.models import Game
-from app.database.connection import SessionLocal
-from app.services.pgn import pgn_service
+from app.services.pgn import encode_moves, pgn_service
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Games per bulk INSERT while streaming a large PGN import
+_IMPORT_BATCH_SIZE = 500
+
 
 @strawberry.type
 class Mutation:
@@ -23,7 +27,8 @@ class Mutation:
         self,
         pgn_text: str,
         user_id: int,
-        source: str = "imported"
+        source: str = "imported",
+        info: strawberry.Info = None
     ) -> PGNImportResult:
         """
         Import PGN text and save games to database
@@ -32,103 +37,41 @@ class Mutation:
             pgn_text: PGN format text (can contain multiple games)
             user_id: ID of user importing the games
             source: Source of import (imported, lichess, chess.com)
+            info: Strawberry info context
 
         Returns:
             PGNImportResult with imported games and any errors
         """
-        # Create database session
-        db = SessionLocal()
+        # Pooled session from the GraphQL context
+        db = info.context["db"]
 
         try:
-            # Parse PGN using PGN service
-            parse_result = pgn_service.parse_pgn(pgn_text)
-
-            if not parse_result.success:
-                return PGNImportResult(
-                    success=False,
-                    games_parsed=0,
-                    games_imported=0,
-                    errors=parse_result.errors,
-                    games=[]
-                )
-
             imported_games = []
+            batch: list = []
+
+            # Parse across the process pool (bulk uploads fan out over
+            # cores), then flush a bulk INSERT every _IMPORT_BATCH_SIZE
+            # rows so one statement never carries the whole file
+            parse_result = await pgn_service.parse_pgn(pgn_text)
             import_errors = list(parse_result.errors)
+            games_parsed = parse_result.games_parsed
 
-            # Save each parsed game to database
             for parsed_game in parse_result.games:
-                try:
-                    # Create Game model instance
-                    game = Game(
-                        user_id=user_id,
-                        pgn=parsed_game.pgn_text,
-                        moves_san=parsed_game.moves_san,
-                        moves_uci=parsed_game.moves,
-                        source=source,
-
-                        # Metadata
-                        event=parsed_game.metadata.event,
-                        site=parsed_game.metadata.site,
-                        round=parsed_game.metadata.round,
-                        date_played=_parse_date(parsed_game.metadata.date),
-
-                        # Players
-                        white_player=parsed_game.metadata.white,
-                        black_player=parsed_game.metadata.black,
-                        white_elo=parsed_game.metadata.white_elo,
-                        black_elo=parsed_game.metadata.black_elo,
-
-                        # Result and opening
-                        result=parsed_game.metadata.result,
-                        eco_code=parsed_game.metadata.eco,
-                        opening_name=parsed_game.metadata.opening,
-
-                        # Position data
-                        fen_start=parsed_game.fen_start,
-                        fen_final=parsed_game.fen_final,
-                        move_count=parsed_game.move_count,
-
-                        # Additional metadata
-                        time_control=parsed_game.metadata.time_control,
-                        termination=parsed_game.metadata.termination
-                    )
-
-                    db.add(game)
-                    db.flush()  # Get the ID without committing
-
-                    # Convert to GraphQL type
-                    game_type = GameType(
-                        id=game.id,
-                        user_id=game.user_id,
-                        pgn=game.pgn,
-                        source=game.source,
-                        source_url=game.source_url,
-                        white_player=game.white_player,
-                        black_player=game.black_player,
-                        white_elo=game.white_elo,
-                        black_elo=game.black_elo,
-                        result=game.result,
-                        event=game.event,
-                        site=game.site,
-                        eco_code=game.eco_code,
-                        opening_name=game.opening_name,
-                        move_count=game.move_count,
-                        date_played=game.date_played,
-                        created_at=game.created_at
-                    )
-                    imported_games.append(game_type)
-
-                except Exception as e:
-                    error_msg = f"Failed to save game: {str(e)}"
-                    logger.error(error_msg)
-                    import_errors.append(error_msg)
+                batch.append(_game_row(parsed_game, user_id, source))
+
+                if len(batch) >= _IMPORT_BATCH_SIZE:
+                    imported_games.extend(await _insert_game_rows(db, batch))
+                    batch = []
+
+            if batch:
+                imported_games.extend(await _insert_game_rows(db, batch))
 
             # Commit all games
-            db.commit()
+            await db.commit()
 
             return PGNImportResult(
                 success=len(imported_games) > 0,
-                games_parsed=parse_result.games_parsed,
+                games_parsed=games_parsed,
                 games_imported=len(imported_games),
                 errors=import_errors,
                 games=imported_games
@@ -136,7 +79,7 @@ class Mutation:
 
         except Exception as e:
             logger.error(f"PGN import failed: {e}")
-            db.rollback()
+            await db.rollback()
             return PGNImportResult(
                 success=False,
                 games_parsed=0,
@@ -144,12 +87,75 @@ class Mutation:
                 errors=[f"Import failed: {str(e)}"],
                 games=[]
             )
-        finally:
-            db.close()
 
 
+def _game_row(parsed_game, user_id: int, source: str) -> dict:
+    """Build a plain dict insert row from a ParsedGame"""
+    return {
+        "user_id": user_id,
+        "pgn": parsed_game.pgn_text,
+        # Packed uint16 encoding (~2 bytes/move); the legacy
+        # moves_san/moves_uci JSON columns are no longer written
+        "moves_binary": encode_moves(parsed_game.moves),
+        "source": source,
+
+        # Metadata
+        "event": parsed_game.metadata.event,
+        "site": parsed_game.metadata.site,
+        "round": parsed_game.metadata.round,
+        "date_played": _parse_date(parsed_game.metadata.date),
+
+        # Players
+        "white_player": parsed_game.metadata.white,
+        "black_player": parsed_game.metadata.black,
+        "white_elo": parsed_game.metadata.white_elo,
+        "black_elo": parsed_game.metadata.black_elo,
+
+        # Result and opening
+        "result": parsed_game.metadata.result,
+        "eco_code": parsed_game.metadata.eco,
+        "opening_name": parsed_game.metadata.opening,
+
+        # Position data
+        "fen_start": parsed_game.fen_start,
+        "fen_final": parsed_game.fen_final,
+        "move_count": parsed_game.move_count,
+
+        # Additional metadata
+        "time_control": parsed_game.metadata.time_control,
+        "termination": parsed_game.metadata.termination,
+    }
+
+
+async def _insert_game_rows(db: AsyncSession, rows: list) -> list:
+    """Bulk-insert one batch of game rows and map them to GameTypes
+
+    One executemany round-trip per batch; RETURNING keeps row order
+    aligned with the parameter list, so no ORM Game instances are ever
+    materialized.
+    """
+    inserted = (await db.execute(
+        insert(Game).returning(
+            Game.id,
+            Game.created_at,
+            sort_by_parameter_order=True,
+        ),
+        rows,
+    )).all()
+
+    return [
+        game_row_to_type(row, id=inserted_id, created_at=created_at)
+        for row, (inserted_id, created_at) in zip(rows, inserted)
+    ]
+
+
+@lru_cache(maxsize=2048)
 def _parse_date(date_str: Optional[str]) -> Optional[datetime]:
-    """Parse PGN date string to datetime"""
+    """Parse PGN date string to datetime
+
+    Memoized: bulk imports (e.g. a tournament PGN) repeat the same few
+    date strings hundreds of times, so repeats become a dict lookup.
+    """
     if not date_str or date_str == "????.??.??":
         return None
 
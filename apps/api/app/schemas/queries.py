@@ -1,15 +1,62 @@
 import strawberry
-from typing import List
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from strawberry.types.nodes import SelectedField
 
 from app.schemas.types import (
     UserType,
     GameType,
+    GameConnection,
     ConceptType,
+    PositionType,
     AnalysisResult,
     EngineScore,
     BestMove,
+    game_to_type,
 )
 from app.services.engine import get_engine_service
+from app.database.models import Game
+
+__all__ = ["Query"]
+
+
+def _find_selected_field(selections, name: str) -> Optional[SelectedField]:
+    """Find a named field in a selection set
+
+    Descends into inline fragments and fragment spreads (whose own
+    `name` is the fragment name, not a field), so selections written as
+    `games { ...GameFields }` resolve the same as plain field lists.
+    """
+    for selection in selections:
+        if isinstance(selection, SelectedField):
+            if selection.name == name:
+                return selection
+        else:
+            found = _find_selected_field(selection.selections, name)
+            if found is not None:
+                return found
+    return None
+
+
+def _positions_to_types(positions) -> List[PositionType]:
+    """Map eager-loaded Position rows to GraphQL types"""
+    return [
+        PositionType(
+            id=p.id,
+            game_id=p.game_id,
+            fen=p.fen,
+            move_number=p.move_number,
+            side_to_move=p.side_to_move,
+            evaluation=p.evaluation,
+            best_move=p.best_move,
+            explanation=p.explanation,
+            difficulty_level=p.difficulty_level,
+        )
+        for p in positions
+    ]
 
 
 @strawberry.type
@@ -24,7 +71,7 @@ class Query:
         return []
 
     @strawberry.field
-    def game(
+    async def game(
         self,
         gameId: int,
         info: strawberry.Info = None
@@ -42,105 +89,90 @@ class Query:
         Raises:
             Exception if game not found
         """
-        from app.database.connection import SessionLocal
-        from app.database.models import Game
-
-        db = SessionLocal()
-        try:
-            game = db.query(Game).filter(Game.id == gameId).first()
-
-            if not game:
-                raise Exception(f"Game with ID {gameId} not found")
-
-            return GameType(
-                id=game.id,
-                user_id=game.user_id,
-                pgn=game.pgn,
-                source=game.source,
-                source_url=game.source_url,
-                white_player=game.white_player,
-                black_player=game.black_player,
-                white_elo=game.white_elo,
-                black_elo=game.black_elo,
-                result=game.result,
-                event=game.event,
-                site=game.site,
-                eco_code=game.eco_code,
-                opening_name=game.opening_name,
-                move_count=game.move_count,
-                date_played=game.date_played,
-                created_at=game.created_at
-            )
-        finally:
-            db.close()
+        db = info.context["db"]
+
+        stmt = select(Game).where(Game.id == gameId).options(
+            selectinload(Game.positions),
+            selectinload(Game.user),
+        )
+        game = (await db.execute(stmt)).scalars().first()
+
+        if not game:
+            raise Exception(f"Game with ID {gameId} not found")
+
+        return game_to_type(game, positions=_positions_to_types(game.positions))
 
     @strawberry.field
-    def games(
+    async def games(
         self,
         user_id: int,
         limit: int = 50,
-        offset: int = 0,
+        after: Optional[datetime] = None,
+        after_id: Optional[int] = None,
         info: strawberry.Info = None
-    ) -> List[GameType]:
+    ) -> GameConnection:
         """
-        Fetch games for a user with pagination
+        Fetch games for a user with keyset pagination
+
+        Pages are addressed by a composite (created_at, id) cursor
+        (`after`/`afterId`) instead of an OFFSET, so page 100 costs the
+        same as page 1. The id component disambiguates created_at ties
+        — bulk imports commit whole batches under one server-side
+        timestamp, so a bare timestamp cursor would skip the rest of a
+        tied run. Batched through a per-request DataLoader: concurrent
+        calls for different users coalesce into one IN (...) query, and
+        GameType rows are built straight from raw column rows (no
+        intermediate ORM instances). Positions stay on the single-game
+        path.
 
         Args:
             user_id: User ID to fetch games for
             limit: Maximum number of games to return (default: 50)
-            offset: Number of games to skip (default: 0)
+            after: created_at cursor from the previous page's nextCursor
+            after_id: id cursor from the previous page's nextCursorId
             info: Strawberry info context
 
         Returns:
-            List of GameType objects
+            GameConnection with the page of games and the next cursor
         """
-        from app.database.connection import SessionLocal
-        from app.database.models import Game
-
-        db = SessionLocal()
-        try:
-            games = db.query(Game).filter(
-                Game.user_id == user_id
-            ).order_by(
-                Game.created_at.desc()
-            ).limit(limit).offset(offset).all()
-
-            return [
-                GameType(
-                    id=game.id,
-                    user_id=game.user_id,
-                    pgn=game.pgn,
-                    source=game.source,
-                    source_url=game.source_url,
-                    white_player=game.white_player,
-                    black_player=game.black_player,
-                    white_elo=game.white_elo,
-                    black_elo=game.black_elo,
-                    result=game.result,
-                    event=game.event,
-                    site=game.site,
-                    eco_code=game.eco_code,
-                    opening_name=game.opening_name,
-                    move_count=game.move_count,
-                    date_played=game.date_played,
-                    created_at=game.created_at
-                )
-                for game in games
-            ]
-        finally:
-            db.close()
+        # Only fetch the pgn Text column when the field set asks for it;
+        # a 50-row page of multi-KB PGN bodies is pure wasted bandwidth
+        # for list views that render metadata only. The pgn field lives
+        # on the nested games selection, possibly behind fragments.
+        selections = info.selected_fields[0].selections if info.selected_fields else []
+        games_field = _find_selected_field(selections, "games")
+        include_pgn = (
+            games_field is not None
+            and _find_selected_field(games_field.selections, "pgn") is not None
+        )
+
+        loader = info.context["game_list_loader"]
+        games = await loader.load((user_id, limit, after, after_id, include_pgn))
+
+        # A short page means the user's games are exhausted
+        if len(games) == limit:
+            next_cursor, next_cursor_id = games[-1].created_at, games[-1].id
+        else:
+            next_cursor = next_cursor_id = None
+        return GameConnection(
+            games=games,
+            next_cursor=next_cursor,
+            next_cursor_id=next_cursor_id,
+        )
 
     @strawberry.field
-    def concepts(self) -> List[ConceptType]:
-        # Placeholder - will implement with database
-        return []
+    def concepts(self, info: strawberry.Info = None) -> List[ConceptType]:
+        # Served from the reference-data cache preloaded at startup
+        concepts_by_id = info.context.get("concepts_by_id", {})
+        return [ConceptType(**concept) for concept in concepts_by_id.values()]
 
     @strawberry.field
     async def analyze_position(
         self,
         fen: str,
         depth: int = 20,
-        multipv: int = 1
+        multipv: int = 1,
+        info: strawberry.Info = None
     ) -> AnalysisResult:
         """
         Analyze a chess position using Stockfish engine
@@ -149,6 +181,7 @@ class Query:
             fen: Position in FEN notation
             depth: Search depth (default: 20, range: 10-30)
             multipv: Number of best moves to return (default: 1, max: 5)
+            info: Strawberry info context
 
         Returns:
             AnalysisResult with best moves and evaluations
@@ -175,11 +208,15 @@ class Query:
                 }
             }
         """
-        # Get engine service
-        engine = await get_engine_service()
-
-        # Analyze position
-        result = await engine.analyze_position(fen, depth, multipv)
+        # Coalesce through the per-request DataLoader when available:
+        # duplicate FENs dedupe to one engine search and distinct ones
+        # run concurrently
+        loader = info.context.get("analysis_loader") if info and info.context else None
+        if loader is not None:
+            result = await loader.load((fen, depth, multipv))
+        else:
+            engine = await get_engine_service()
+            result = await engine.analyze_position(fen, depth, multipv)
 
         # Convert to GraphQL types
         best_moves = [
@@ -1,6 +1,16 @@
 import strawberry
+from strawberry.extensions import ParserCache, ValidationCache
 
 from app.schemas.queries import Query
 from app.schemas.mutations import Mutation
 
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+# Cache parsed + validated query documents so repeat queries (clients
+# send the same handful of operations) skip parse/validate entirely
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[
+        ParserCache(maxsize=256),
+        ValidationCache(maxsize=256),
+    ],
+)
@@ -13,11 +13,26 @@ class UserType:
     created_at: datetime
 
 
+@strawberry.type
+class PositionType:
+    id: int
+    game_id: int
+    fen: str
+    move_number: int
+    side_to_move: str
+    evaluation: Optional[float]
+    best_move: Optional[str]
+    explanation: Optional[str]
+    difficulty_level: Optional[str]
+
+
 @strawberry.type
 class GameType:
     id: int
     user_id: int
-    pgn: str
+    # Optional because list queries only fetch the pgn Text column when
+    # the GraphQL selection actually asks for it
+    pgn: Optional[str]
     source: str
     source_url: Optional[str]
     white_player: Optional[str]
@@ -32,19 +47,70 @@ class GameType:
     move_count: int
     date_played: Optional[datetime]
     created_at: datetime
+    # Populated from the eager-loaded relationship (selectinload) so
+    # requesting positions never fires a per-game query
+    positions: List[PositionType] = strawberry.field(default_factory=list)
+
+
+# Scalar fields copied from a Game row into GameType; single source of
+# truth for the mapping helpers below
+_GAME_FIELDS = (
+    "id",
+    "user_id",
+    "pgn",
+    "source",
+    "source_url",
+    "white_player",
+    "black_player",
+    "white_elo",
+    "black_elo",
+    "result",
+    "event",
+    "site",
+    "eco_code",
+    "opening_name",
+    "move_count",
+    "date_played",
+    "created_at",
+)
+
+
+def game_to_type(game, **overrides) -> GameType:
+    """Map a Game ORM row to a GameType in one pass
+
+    Builds the kwargs dict with a comprehension over _GAME_FIELDS (one
+    C-level getattr per field) instead of a 16-line literal constructor
+    at every call site. Extra GameType fields (e.g. positions) can be
+    passed as overrides.
+    """
+    fields = {name: getattr(game, name) for name in _GAME_FIELDS}
+    if overrides:
+        fields.update(overrides)
+    return GameType(**fields)
+
+
+def game_row_to_type(row, **overrides) -> GameType:
+    """Map a plain dict insert row to a GameType
+
+    Missing keys (e.g. id/created_at before RETURNING values are known)
+    default to None and are expected in overrides.
+    """
+    fields = {name: row.get(name) for name in _GAME_FIELDS}
+    if overrides:
+        fields.update(overrides)
+    return GameType(**fields)
 
 
 @strawberry.type
-class PositionType:
-    id: int
-    game_id: int
-    fen: str
-    move_number: int
-    side_to_move: str
-    evaluation: Optional[float]
-    best_move: Optional[str]
-    explanation: Optional[str]
-    difficulty_level: Optional[str]
+class GameConnection:
+    """One page of games plus the keyset cursor for the next page"""
+    games: List[GameType]
+    # (created_at, id) of the last game in this page; pass both back as
+    # `after`/`afterId` to get the next page. The id component breaks
+    # created_at ties (bulk imports commit whole batches with one
+    # server-side timestamp). None when there are no further pages.
+    next_cursor: Optional[datetime]
+    next_cursor_id: Optional[int]
 
 
 @strawberry.type
@@ -6,8 +6,11 @@ Inspired by en-croissant's engine implementation, adapted for Python/FastAPI.
 """
 
 import asyncio
+import os
 import chess
 import chess.engine
+import orjson
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import logging
@@ -15,14 +18,38 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def normalize_fen(fen: str) -> str:
+    """Strip the halfmove/fullmove counters from a FEN
+
+    Two positions differing only in move counters are identical for
+    analysis purposes, so normalizing maximizes cache hits when the
+    same position is reached at different points in a game.
+    """
+    return " ".join(fen.split(" ")[:4])
+
+
+# Bound once at module scope so the analysis hot path skips the
+# per-move attribute lookup
+_uci = chess.Move.uci
+
+
+def _score_sort_key(best_move: "BestMove") -> int:
+    """Order moves best-first: quick mates above everything, then
+    centipawns, then being mated (slower mates rank less bad)"""
+    if best_move.score.type == "mate":
+        value = best_move.score.value
+        return 1_000_000 - value if value > 0 else -1_000_000 - value
+    return best_move.score.value
+
+
+@dataclass(slots=True)
 class EngineScore:
     """Engine evaluation score"""
     type: str  # "cp" (centipawns) or "mate"
     value: int  # Centipawns or moves to mate
 
 
-@dataclass
+@dataclass(slots=True)
 class BestMove:
     """Best move analysis from engine"""
     move: str  # UCI format (e.g., "e2e4")
@@ -33,14 +60,48 @@ class BestMove:
     multipv: int  # MultiPV index (1 = best, 2 = second best, etc.)
     nps: int  # Nodes per second
 
+    @property
+    def pv_uci_str(self) -> str:
+        """Space-separated PV, for serializers that emit one string
+        instead of rendering a JSON array"""
+        return " ".join(self.pv)
+
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete analysis result for a position"""
     fen: str
     best_moves: List[BestMove]
     depth: int
 
+    def to_dict(self) -> dict:
+        """Plain-dict form for serialization
+
+        Hand-built instead of dataclasses.asdict, which recursively
+        deep-copies every nested field on each call.
+        """
+        return {
+            "fen": self.fen,
+            "depth": self.depth,
+            "best_moves": [
+                {
+                    "move": bm.move,
+                    "san": bm.san,
+                    "score": {"type": bm.score.type, "value": bm.score.value},
+                    "depth": bm.depth,
+                    "pv": bm.pv,
+                    "multipv": bm.multipv,
+                    "nps": bm.nps,
+                }
+                for bm in self.best_moves
+            ],
+        }
+
+
+def to_json(result: AnalysisResult) -> bytes:
+    """Serialize an AnalysisResult straight to JSON bytes via orjson"""
+    return orjson.dumps(result.to_dict())
+
 
 class EngineService:
     """
@@ -48,30 +109,81 @@ class EngineService:
 
     Uses python-chess library to communicate with Stockfish via UCI protocol.
     Supports MultiPV (multiple principal variations) for showing alternative moves.
+
+    Runs a pool of single-threaded Stockfish processes: one engine can
+    only search one position at a time, so concurrent analyses (e.g. a
+    full-game scan) scale with the pool instead of queueing behind a
+    single process.
     """
 
-    def __init__(self, engine_path: str = "/usr/games/stockfish"):
+    # Target depth for deep_analysis
+    _DEEP_DEPTH = 25
+
+    def __init__(
+        self,
+        engine_path: str = "/usr/games/stockfish",
+        pool_size: Optional[int] = None,
+        hash_mb: int = 256,
+        threads: int = 1
+    ):
         """
         Initialize engine service
 
         Args:
             engine_path: Path to Stockfish binary
+            pool_size: Number of engine processes
+                (default: min(cpu_count, 4))
+            hash_mb: Transposition-table size per engine in MB; bigger
+                tables recompute fewer subtrees across analyse calls
+            threads: Search threads per engine (default 1; the pool
+                provides the parallelism)
         """
         self.engine_path = engine_path
-        self.engine: Optional[chess.engine.SimpleEngine] = None
+        self.pool_size = pool_size or min(os.cpu_count() or 1, 4)
+        self.hash_mb = hash_mb
+        self.threads = threads
+        # Async UciProtocol instances from popen_uci, not the
+        # SimpleEngine sync wrapper: analyse awaits on the event loop
+        # directly instead of hopping through a background thread
+        self._pool: "Optional[asyncio.Queue[chess.engine.UciProtocol]]" = None
+        self._engines: List[chess.engine.UciProtocol] = []
         self._lock = asyncio.Lock()
+        # Transposition-style LRU cache: (normalized fen, multipv) ->
+        # (depth analyzed at, result). A hit at equal or greater depth
+        # skips the engine entirely.
+        self._cache: "OrderedDict[Tuple[str, int], Tuple[int, AnalysisResult]]" = OrderedDict()
+        self._cache_max = 8192
 
     async def start(self) -> None:
-        """Start the chess engine process"""
-        if self.engine is not None:
-            logger.warning("Engine already started")
+        """Start the pool of chess engine processes"""
+        if self._pool is not None:
+            logger.warning("Engine pool already started")
             return
 
         try:
             async with self._lock:
-                transport, engine = await chess.engine.popen_uci(self.engine_path)
-                self.engine = engine
-                logger.info(f"Stockfish engine started: {engine.id}")
+                pool: asyncio.Queue = asyncio.Queue()
+                for _ in range(self.pool_size):
+                    transport, engine = await chess.engine.popen_uci(self.engine_path)
+                    # Configured once per worker: single-threaded
+                    # search (the pool provides parallelism; Stockfish
+                    # scales sublinearly with threads on one position)
+                    # and a large hash so the in-engine transposition
+                    # table carries over between analyse calls. Ponder
+                    # is managed by python-chess and cannot be set here
+                    # (and analyse never ponders anyway).
+                    await engine.configure({
+                        "Threads": self.threads,
+                        "Hash": self.hash_mb,
+                        "Move Overhead": 10,
+                    })
+                    self._engines.append(engine)
+                    pool.put_nowait(engine)
+                self._pool = pool
+                logger.info(
+                    f"Stockfish engine pool started "
+                    f"({self.pool_size} workers): {self._engines[0].id}"
+                )
         except FileNotFoundError:
             logger.error(f"Stockfish binary not found at {self.engine_path}")
             raise
@@ -80,20 +192,24 @@ class EngineService:
             raise
 
     async def stop(self) -> None:
-        """Stop the chess engine process"""
-        if self.engine is None:
+        """Stop all chess engine processes"""
+        if self._pool is None:
             return
 
         async with self._lock:
-            await self.engine.quit()
-            self.engine = None
-            logger.info("Stockfish engine stopped")
+            for engine in self._engines:
+                await engine.quit()
+            self._engines = []
+            self._pool = None
+            logger.info("Stockfish engine pool stopped")
 
     async def analyze_position(
         self,
         fen: str,
         depth: int = 20,
-        multipv: int = 1
+        multipv: int = 1,
+        pv_max_len: int = 16,
+        want_san: bool = True
     ) -> AnalysisResult:
         """
         Analyze a chess position
@@ -102,6 +218,10 @@ class EngineService:
             fen: Position in FEN notation
             depth: Search depth (default 20)
             multipv: Number of best moves to return (default 1)
+            pv_max_len: Plies of each PV to keep (the best move itself
+                is always preserved)
+            want_san: Convert the best move to SAN; background
+                evaluation-only callers can skip it
 
         Returns:
             AnalysisResult with best moves and evaluations
@@ -110,9 +230,13 @@ class EngineService:
             ValueError: If FEN is invalid
             RuntimeError: If engine is not started
         """
-        if self.engine is None:
+        if self._pool is None:
             raise RuntimeError("Engine not started. Call start() first.")
 
+        cached = self._cache_get(fen, depth, multipv, pv_max_len, want_san)
+        if cached is not None:
+            return cached
+
         try:
             # Parse FEN into chess.Board
             board = chess.Board(fen)
@@ -120,16 +244,112 @@ class EngineService:
             logger.error(f"Invalid FEN: {fen}")
             raise ValueError(f"Invalid FEN: {e}")
 
-        # Analyze position
+        return await self._analyze_board(
+            board, fen, depth, multipv, pv_max_len, want_san
+        )
+
+    async def analyze_board(
+        self,
+        board: chess.Board,
+        depth: int = 20,
+        multipv: int = 1,
+        pv_max_len: int = 16,
+        want_san: bool = True
+    ) -> AnalysisResult:
+        """
+        Analyze a position from an existing chess.Board
+
+        Batch callers that walk a game by pushing moves already hold a
+        Board; this skips the FEN serialize/re-parse round-trip that
+        analyze_position would do.
+
+        Args:
+            board: Position to analyze
+            depth: Search depth (default 20)
+            multipv: Number of best moves to return (default 1)
+            pv_max_len: Plies of each PV to keep
+            want_san: Convert the best move to SAN
+
+        Returns:
+            AnalysisResult with best moves and evaluations
+
+        Raises:
+            RuntimeError: If engine is not started
+        """
+        if self._pool is None:
+            raise RuntimeError("Engine not started. Call start() first.")
+
+        fen = board.fen()
+        cached = self._cache_get(fen, depth, multipv, pv_max_len, want_san)
+        if cached is not None:
+            return cached
+
+        return await self._analyze_board(
+            board, fen, depth, multipv, pv_max_len, want_san
+        )
+
+    def _cache_get(
+        self,
+        fen: str,
+        depth: int,
+        multipv: int,
+        pv_max_len: int,
+        want_san: bool
+    ) -> Optional[AnalysisResult]:
+        """Serve position revisits (PGN scrubbing, re-opened games) from
+        the cache when the stored analysis is at least as deep"""
+        cache_key = (normalize_fen(fen), multipv, pv_max_len, want_san)
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] >= depth:
+            self._cache.move_to_end(cache_key)
+            return AnalysisResult(
+                fen=fen,
+                best_moves=cached[1].best_moves,
+                depth=depth
+            )
+        return None
+
+    def _cache_put(
+        self,
+        fen: str,
+        depth: int,
+        multipv: int,
+        pv_max_len: int,
+        want_san: bool,
+        result: AnalysisResult
+    ) -> None:
+        """Store a result in the LRU cache, evicting the oldest entry"""
+        cache_key = (normalize_fen(fen), multipv, pv_max_len, want_san)
+        self._cache[cache_key] = (depth, result)
+        self._cache.move_to_end(cache_key)
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+
+    async def _analyze_board(
+        self,
+        board: chess.Board,
+        fen: str,
+        depth: int,
+        multipv: int,
+        pv_max_len: int = 16,
+        want_san: bool = True
+    ) -> AnalysisResult:
+        """Run the engine on a board and cache the parsed result"""
+        # Analyze position on a worker checked out from the pool; other
+        # callers keep the remaining workers busy concurrently. The
+        # stackless copy is O(1) and keeps the engine off caller state.
+        engine = await self._pool.get()
         try:
-            info = await self.engine.analyse(
-                board,
+            info = await engine.analyse(
+                board.copy(stack=False),
                 chess.engine.Limit(depth=depth),
                 multipv=multipv
             )
         except Exception as e:
             logger.error(f"Engine analysis failed: {e}")
             raise
+        finally:
+            self._pool.put_nowait(engine)
 
         # Parse results
         best_moves = []
@@ -138,26 +358,38 @@ class EngineService:
         if isinstance(info, list):
             # MultiPV mode - list of info dicts
             for idx, pv_info in enumerate(info, start=1):
-                best_move = self._parse_analysis_info(pv_info, board, multipv=idx)
+                best_move = self._parse_analysis_info(
+                    pv_info, board, multipv=idx,
+                    pv_max_len=pv_max_len, want_san=want_san
+                )
                 if best_move:
                     best_moves.append(best_move)
         else:
             # Single PV mode - one info dict
-            best_move = self._parse_analysis_info(info, board, multipv=1)
+            best_move = self._parse_analysis_info(
+                info, board, multipv=1,
+                pv_max_len=pv_max_len, want_san=want_san
+            )
             if best_move:
                 best_moves.append(best_move)
 
-        return AnalysisResult(
+        result = AnalysisResult(
             fen=fen,
             best_moves=best_moves,
             depth=depth
         )
 
+        self._cache_put(fen, depth, multipv, pv_max_len, want_san, result)
+
+        return result
+
     def _parse_analysis_info(
         self,
         info: chess.engine.InfoDict,
         board: chess.Board,
-        multipv: int
+        multipv: int,
+        pv_max_len: int = 16,
+        want_san: bool = True
     ) -> Optional[BestMove]:
         """
         Parse engine analysis info into BestMove
@@ -166,6 +398,10 @@ class EngineService:
             info: Analysis info from engine
             board: Current chess board
             multipv: MultiPV index
+            pv_max_len: Plies of the PV to convert; deep searches
+                return 40-ply lines the UI never renders in full
+            want_san: Convert the best move to SAN (one legal-move
+                generation); skipped for evaluation-only callers
 
         Returns:
             BestMove or None if parsing fails
@@ -181,11 +417,12 @@ class EngineService:
             if not pv:
                 return None
 
-            # First move in PV is the best move
-            best_move_uci = pv[0]
+            # Convert the truncated PV to UCI strings; map pushes the
+            # loop to C, and the best move (pv[0]) always survives
+            pv_uci = list(map(_uci, pv[:pv_max_len] if pv_max_len else pv))
 
-            # Convert to SAN notation
-            best_move_san = board.san(best_move_uci)
+            # Convert to SAN notation when the caller will display it
+            best_move_san = board.san(pv[0]) if want_san else ""
 
             # Parse score
             if score.is_mate():
@@ -205,11 +442,8 @@ class EngineService:
             # Get nodes per second
             nps = info.get("nps", 0)
 
-            # Convert PV to UCI strings
-            pv_uci = [move.uci() for move in pv]
-
             return BestMove(
-                move=best_move_uci.uci(),
+                move=pv_uci[0],
                 san=best_move_san,
                 score=engine_score,
                 depth=depth,
@@ -232,20 +466,99 @@ class EngineService:
         Returns:
             AnalysisResult with quick evaluation
         """
-        return await self.analyze_position(fen, depth=10, multipv=1)
+        # Short PV: quick evals feed inline hints, not full lines
+        return await self.analyze_position(fen, depth=10, multipv=1, pv_max_len=8)
 
-    async def deep_analysis(self, fen: str, lines: int = 3) -> AnalysisResult:
+    async def deep_analysis(
+        self,
+        fen: str,
+        lines: int = 3,
+        pv_max_len: int = 12,
+        want_san: bool = True
+    ) -> AnalysisResult:
         """
         Deep analysis with multiple lines
 
+        MultiPV makes one engine split its search across all lines and
+        scales sublinearly, so this instead probes shallowly for the
+        top candidates and deepens each one as a single-PV search
+        restricted to that root move, run concurrently across the pool.
+
         Args:
             fen: Position in FEN notation
             lines: Number of best moves to analyze (default 3)
+            pv_max_len: Plies of each PV to keep
+            want_san: Convert best moves to SAN
 
         Returns:
             AnalysisResult with deep analysis of multiple lines
         """
-        return await self.analyze_position(fen, depth=25, multipv=lines)
+        cached = self._cache_get(fen, self._DEEP_DEPTH, lines, pv_max_len, want_san)
+        if cached is not None:
+            return cached
+
+        # Shallow probe to pick the candidate root moves
+        probe = await self.analyze_position(
+            fen, depth=10, multipv=lines, pv_max_len=pv_max_len, want_san=want_san
+        )
+        candidates = [bm.move for bm in probe.best_moves]
+
+        if len(candidates) <= 1:
+            return await self.analyze_position(
+                fen, depth=self._DEEP_DEPTH, multipv=lines,
+                pv_max_len=pv_max_len, want_san=want_san
+            )
+
+        board = chess.Board(fen)
+        deepened = await asyncio.gather(*(
+            self._analyze_root_move(
+                board, move, self._DEEP_DEPTH, pv_max_len, want_san
+            )
+            for move in candidates
+        ))
+
+        best_moves = sorted(
+            (bm for bm in deepened if bm is not None),
+            key=_score_sort_key,
+            reverse=True
+        )
+        for idx, bm in enumerate(best_moves, start=1):
+            bm.multipv = idx
+
+        result = AnalysisResult(fen=fen, best_moves=best_moves, depth=self._DEEP_DEPTH)
+
+        self._cache_put(fen, self._DEEP_DEPTH, lines, pv_max_len, want_san, result)
+
+        return result
+
+    async def _analyze_root_move(
+        self,
+        board: chess.Board,
+        move_uci: str,
+        depth: int,
+        pv_max_len: int = 16,
+        want_san: bool = True
+    ) -> Optional[BestMove]:
+        """Deepen a single candidate move with a search restricted to it"""
+        engine = await self._pool.get()
+        try:
+            info = await engine.analyse(
+                board.copy(stack=False),
+                chess.engine.Limit(depth=depth),
+                root_moves=[chess.Move.from_uci(move_uci)],
+                multipv=1
+            )
+        except Exception as e:
+            logger.error(f"Engine analysis failed: {e}")
+            raise
+        finally:
+            self._pool.put_nowait(engine)
+
+        if isinstance(info, list):
+            info = info[0]
+        return self._parse_analysis_info(
+            info, board, multipv=1, pv_max_len=pv_max_len, want_san=want_san
+        )
 
 
 # Global engine instance (singleton)
@@ -262,8 +575,12 @@ async def get_engine_service() -> EngineService:
     global _engine_service
 
     if _engine_service is None:
-        _engine_service = EngineService()
-        await _engine_service.start()
+        # Assign the singleton only after a successful start; otherwise
+        # one failed startup leaves a dead service (pool still None)
+        # that every later call would keep returning
+        service = EngineService()
+        await service.start()
+        _engine_service = service
 
     return _engine_service
 
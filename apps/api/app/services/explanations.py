@@ -0,0 +1,129 @@
+"""
+Explanation Cache Service
+
+Two-tier cache for AI-generated position explanations: a Redis hot
+tier keyed by FEN hash, with the ExplanationCache table as the
+write-through cold tier. Redis being down degrades to Postgres-only
+lookups rather than failing requests.
+"""
+
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.database.models import ExplanationCache, fen_hash
+
+logger = logging.getLogger(__name__)
+
+# Hot-tier entries expire after a day; Postgres keeps them forever
+_TTL_SECONDS = 86400
+
+
+class ExplanationCacheService:
+    """
+    Cache lookups for AI move explanations
+
+    Reads hit Redis first (~100 us) and fall back to Postgres (~1 ms),
+    re-priming Redis on a cold hit. Writes go to both tiers.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None):
+        self.redis_url = redis_url or settings.redis_url
+        self._redis: Optional[redis.Redis] = None
+
+    def _client(self) -> redis.Redis:
+        """Lazily create the Redis client (one per process)"""
+        if self._redis is None:
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    @staticmethod
+    def _key(fen: str, rating_range: str) -> str:
+        return f"explain:{fen_hash(fen)}:{rating_range}"
+
+    async def get(self, db: AsyncSession, fen: str, rating_range: str) -> Optional[str]:
+        """
+        Look up a cached explanation
+
+        Args:
+            db: Database session for the cold tier
+            fen: Position in FEN notation
+            rating_range: User rating bucket (e.g. "1200-1400")
+
+        Returns:
+            Explanation text, or None on a full miss
+        """
+        key = self._key(fen, rating_range)
+
+        try:
+            cached = await self._client().get(key)
+            if cached is not None:
+                return cached
+        except Exception as e:
+            logger.warning(f"Redis read failed, falling back to Postgres: {e}")
+
+        stmt = select(ExplanationCache).where(
+            ExplanationCache.fen_hash == fen_hash(fen),
+            ExplanationCache.fen == fen,
+            ExplanationCache.user_rating_range == rating_range,
+        )
+        row = (await db.execute(stmt)).scalars().first()
+
+        if row is None:
+            return None
+
+        # Re-prime the hot tier so the next lookup skips Postgres
+        try:
+            await self._client().set(key, row.explanation, ex=_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Redis write failed: {e}")
+
+        return row.explanation
+
+    async def set(
+        self,
+        db: AsyncSession,
+        fen: str,
+        rating_range: str,
+        explanation: str,
+        ai_model: str
+    ) -> None:
+        """
+        Store an explanation in both tiers
+
+        Args:
+            db: Database session for the cold tier
+            fen: Position in FEN notation
+            rating_range: User rating bucket (e.g. "1200-1400")
+            explanation: AI-generated explanation text
+            ai_model: Model identifier that produced the explanation
+        """
+        db.add(ExplanationCache(
+            fen=fen,
+            fen_hash=fen_hash(fen),
+            user_rating_range=rating_range,
+            explanation=explanation,
+            ai_model_used=ai_model,
+        ))
+        await db.commit()
+
+        try:
+            await self._client().set(
+                self._key(fen, rating_range), explanation, ex=_TTL_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"Redis write failed: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis connection"""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+# Global explanation cache instance
+explanation_cache_service = ExplanationCacheService()
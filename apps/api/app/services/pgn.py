@@ -5,18 +5,210 @@ Provides PGN (Portable Game Notation) import/export functionality.
 Uses python-chess library for parsing and validation.
 """
 
+import asyncio
 import io
+import os
+import re
+import struct
+import threading
 import chess
 import chess.pgn
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterator, List, Optional, Dict, Any, Union
 from dataclasses import dataclass
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Splits a multi-game PGN into raw per-game strings on [Event headers,
+# so games can be parsed independently across worker processes
+_GAME_SPLIT = re.compile(r'(?ms)^\[Event ".*?(?=^\[Event "|\Z)')
 
-@dataclass
+# Byte-level boundary pattern for uploads that arrive as bytes, so
+# games can be sliced without first decoding the whole file
+_GAME_BOUNDARY = re.compile(rb'(?m)^\[Event ')
+
+# Move-number prefix in a variation_san token: "1." or, when Black
+# moves first from a custom setup, "1..." fused onto the SAN ("1...e5")
+_SAN_NUM_PREFIX = re.compile(r"^\d+\.(?:\.\.)?")
+
+# Below this many games the process-pool IPC overhead outweighs the
+# parallelism; parse inline instead
+_PROCESS_POOL_MIN_GAMES = 8
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared PGN parsing process pool"""
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _parse_pool
+
+
+def _open_pgn(pgn_text: Union[str, bytes]):
+    """Wrap PGN input in a text stream for chess.pgn.read_game
+
+    Bytes are wrapped in a TextIOWrapper over a BytesIO, decoding
+    incrementally as the parser reads instead of materializing a second
+    full-size str copy of the upload.
+    """
+    if isinstance(pgn_text, bytes):
+        return io.TextIOWrapper(io.BytesIO(pgn_text), encoding="utf-8", newline="")
+    return io.StringIO(pgn_text)
+
+
+def _split_raw_games(pgn_text: Union[str, bytes], max_games: int) -> List[Union[str, bytes]]:
+    """Slice a multi-game PGN into raw per-game chunks
+
+    Bytes input is sliced on byte offsets from the precompiled boundary
+    pattern, skipping the whole-file decode; each slice is decoded in
+    the worker that parses it.
+    """
+    if isinstance(pgn_text, bytes):
+        offsets = [m.start() for m in _GAME_BOUNDARY.finditer(pgn_text)]
+        bounds = offsets + [len(pgn_text)]
+        return [
+            pgn_text[bounds[i]:bounds[i + 1]]
+            for i in range(min(len(offsets), max_games))
+        ]
+    return _GAME_SPLIT.findall(pgn_text)[:max_games]
+
+
+# Shared options for PGN string export, kept in one place so every
+# exporter renders identically
+_EXPORTER_OPTS = {"headers": True, "variations": False, "comments": False}
+
+@lru_cache(maxsize=8192)
+def _parse_elo_cached(elo_str: Optional[str]) -> Optional[int]:
+    """Parse an ELO rating string
+
+    Memoized: a bulk import sees the same few hundred distinct rating
+    strings over and over, so repeats skip the int() conversion. Module
+    level rather than on the staticmethod so lru_cache wraps a plain
+    function (each parse worker process gets its own cache).
+    """
+    if not elo_str or elo_str == "?":
+        return None
+    try:
+        return int(elo_str)
+    except (ValueError, TypeError):
+        return None
+
+
+_exporter_local = threading.local()
+
+
+def _get_exporter() -> chess.pgn.StringExporter:
+    """Reuse one StringExporter per thread
+
+    StringExporter has no public reset, so re-running __init__ clears
+    its line buffers in place instead of allocating fresh formatter
+    state per export. Parse worker processes each get their own local.
+    """
+    exporter = getattr(_exporter_local, "exporter", None)
+    if exporter is None:
+        exporter = chess.pgn.StringExporter(**_EXPORTER_OPTS)
+        _exporter_local.exporter = exporter
+    else:
+        exporter.__init__(**_EXPORTER_OPTS)
+    return exporter
+
+# PGN header tag -> GameMetadata field, for the one-pass metadata
+# build (ELO tags are handled separately through _parse_elo)
+_META_FIELDS = (
+    ("Event", "event"),
+    ("Site", "site"),
+    ("Date", "date"),
+    ("Round", "round"),
+    ("White", "white"),
+    ("Black", "black"),
+    ("Result", "result"),
+    ("ECO", "eco"),
+    ("Opening", "opening"),
+    ("TimeControl", "time_control"),
+    ("Termination", "termination"),
+)
+
+
+def _parse_game_text(raw_pgn: Union[str, bytes], want_san: bool = False) -> "ParsedGame":
+    """Parse one raw PGN game chunk
+
+    Module-level so it pickles cleanly into worker processes; each
+    worker gets its own stream cursor instead of sharing one parser.
+    """
+    game = chess.pgn.read_game(_open_pgn(raw_pgn))
+    if game is None:
+        raise ValueError("No valid game found in PGN")
+    if isinstance(raw_pgn, bytes):
+        raw_pgn = raw_pgn.decode("utf-8")
+    return PGNService._parse_single_game(game, want_san=want_san, raw_pgn=raw_pgn)
+
+# Binary move encoding: one uint16 per move,
+# bits 0-5 from-square, bits 6-11 to-square, bits 12-15 promotion piece
+# type (0 = none). ~2 bytes per move vs ~10 bytes as a JSON list entry.
+_PROMO_CHARS = {chess.KNIGHT: "n", chess.BISHOP: "b", chess.ROOK: "r", chess.QUEEN: "q"}
+_PROMO_TYPES = {c: t for t, c in _PROMO_CHARS.items()}
+
+# Square-name lookup so bulk UCI parsing is two dict hits instead of
+# chess.Move.from_uci's generic string validation
+_SQ = {name: square for square, name in enumerate(chess.SQUARE_NAMES)}
+
+
+def _fast_uci(uci: str) -> chess.Move:
+    """Parse a well-formed 4/5-char UCI string via table lookups
+
+    Raises KeyError on anything else (null moves, malformed input);
+    callers fall back to chess.Move.from_uci for those.
+    """
+    length = len(uci)
+    if length == 4:
+        return chess.Move(_SQ[uci[:2]], _SQ[uci[2:]])
+    if length == 5:
+        return chess.Move(_SQ[uci[:2]], _SQ[uci[2:4]], promotion=_PROMO_TYPES[uci[4]])
+    raise KeyError(uci)
+
+
+def encode_moves(moves_uci: List[str]) -> bytes:
+    """Pack a list of UCI moves into 2 bytes per move
+
+    The null move "0000" encodes as 0, which cannot collide with a real
+    move (a move from a1 to a1 is never legal).
+    """
+    packed = []
+    for uci in moves_uci:
+        if uci == "0000":
+            packed.append(0)
+            continue
+        from_sq = chess.parse_square(uci[:2])
+        to_sq = chess.parse_square(uci[2:4])
+        promo = _PROMO_TYPES[uci[4]] if len(uci) == 5 else 0
+        packed.append((promo << 12) | (to_sq << 6) | from_sq)
+    return struct.pack(f"<{len(packed)}H", *packed)
+
+
+def decode_moves(blob: bytes) -> List[str]:
+    """Unpack a binary move blob back into UCI strings"""
+    count = len(blob) // 2
+    moves_uci = []
+    for value in struct.unpack(f"<{count}H", blob):
+        if value == 0:
+            moves_uci.append("0000")
+            continue
+        from_sq = value & 0x3F
+        to_sq = (value >> 6) & 0x3F
+        promo = value >> 12
+        uci = chess.SQUARE_NAMES[from_sq] + chess.SQUARE_NAMES[to_sq]
+        if promo:
+            uci += _PROMO_CHARS[promo]
+        moves_uci.append(uci)
+    return moves_uci
+
+
+@dataclass(frozen=True, slots=True)
 class GameMetadata:
     """Metadata extracted from PGN headers"""
     event: Optional[str] = None
@@ -34,19 +226,37 @@ class GameMetadata:
     termination: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedGame:
     """A parsed chess game from PGN"""
     metadata: GameMetadata
     moves: List[str]  # UCI format moves (e.g., ["e2e4", "e7e5", ...])
-    moves_san: List[str]  # SAN format moves (e.g., ["e4", "e5", ...])
+    moves_san: Optional[List[str]]  # SAN moves; None until ensure_san()
     pgn_text: str  # Original PGN text
     fen_start: str  # Starting position FEN
     fen_final: str  # Final position FEN
     move_count: int
 
+    def ensure_san(self) -> List[str]:
+        """Compute SAN moves on first access
+
+        SAN disambiguation generates the full legal-move list at every
+        ply, which dominates parse cost, so it is skipped during import
+        (the database stores UCI) and replayed here only for callers
+        that actually display SAN.
+        """
+        if self.moves_san is None:
+            board = chess.Board(self.fen_start)
+            moves_san = []
+            for uci in self.moves:
+                move = chess.Move.from_uci(uci)
+                moves_san.append(board.san(move))
+                board.push(move)
+            self.moves_san = moves_san
+        return self.moves_san
 
-@dataclass
+
+@dataclass(slots=True)
 class PGNImportResult:
     """Result of PGN import operation"""
     success: bool
@@ -69,40 +279,107 @@ class PGNService:
     """
 
     @staticmethod
-    def parse_pgn(pgn_text: str, max_games: int = 100) -> PGNImportResult:
+    def iter_games(
+        pgn_text: Union[str, bytes],
+        max_games: int = 100,
+        errors: Optional[List[str]] = None,
+        want_san: bool = False
+    ) -> Iterator[ParsedGame]:
+        """
+        Incrementally parse PGN text, yielding one game at a time
+
+        Lets callers pipeline parsing with downstream work (e.g. batched
+        database inserts) and keeps peak memory at one game instead of
+        the whole file.
+
+        Args:
+            pgn_text: PGN format text (can contain multiple games)
+            max_games: Maximum number of games to parse (default 100)
+            errors: Optional list that collects per-game parse errors
+            want_san: Also compute SAN moves for each game
+
+        Yields:
+            ParsedGame for each successfully parsed game
+        """
+        # Wrap input for the python-chess parser (str or raw bytes)
+        pgn_io = _open_pgn(pgn_text)
+
+        game_count = 0
+        while game_count < max_games:
+            # Parse next game
+            game = chess.pgn.read_game(pgn_io)
+            if game is None:
+                break  # No more games
+
+            game_count += 1
+
+            try:
+                yield PGNService._parse_single_game(game, want_san=want_san)
+            except Exception as e:
+                error_msg = f"Game {game_count}: {str(e)}"
+                logger.error(f"Failed to parse game {game_count}: {e}")
+                if errors is not None:
+                    errors.append(error_msg)
+
+    @staticmethod
+    async def parse_pgn(
+        pgn_text: Union[str, bytes],
+        max_games: int = 100,
+        want_san: bool = False
+    ) -> PGNImportResult:
         """
         Parse PGN text and extract game data
 
+        Bulk uploads are split into raw per-game strings (a cheap regex
+        scan) and fanned out across a process pool, so parsing scales
+        with cores and never blocks the event loop. Small inputs are
+        parsed inline to skip the pickling overhead.
+
         Args:
             pgn_text: PGN format text (can contain multiple games)
             max_games: Maximum number of games to parse (default 100)
+            want_san: Also compute SAN moves for each game
 
         Returns:
             PGNImportResult with parsed games and any errors
         """
-        games: List[ParsedGame] = []
         errors: List[str] = []
 
         try:
-            # Create string IO for python-chess parser
-            pgn_io = io.StringIO(pgn_text)
-
-            game_count = 0
-            while game_count < max_games:
-                # Parse next game
-                game = chess.pgn.read_game(pgn_io)
-                if game is None:
-                    break  # No more games
-
-                game_count += 1
-
-                try:
-                    parsed_game = PGNService._parse_single_game(game)
-                    games.append(parsed_game)
-                except Exception as e:
-                    error_msg = f"Game {game_count}: {str(e)}"
-                    logger.error(f"Failed to parse game {game_count}: {e}")
-                    errors.append(error_msg)
+            raw_games = _split_raw_games(pgn_text, max_games)
+
+            if not raw_games:
+                # No [Event headers (bare movetext); fall back to the
+                # streaming reader, which handles headerless games
+                games = list(
+                    PGNService.iter_games(pgn_text, max_games, errors, want_san)
+                )
+            elif len(raw_games) < _PROCESS_POOL_MIN_GAMES:
+                games = []
+                for game_count, raw in enumerate(raw_games, start=1):
+                    try:
+                        games.append(_parse_game_text(raw, want_san))
+                    except Exception as e:
+                        logger.error(f"Failed to parse game {game_count}: {e}")
+                        errors.append(f"Game {game_count}: {e}")
+            else:
+                loop = asyncio.get_running_loop()
+                pool = _get_parse_pool()
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(pool, _parse_game_text, raw, want_san)
+                        for raw in raw_games
+                    ),
+                    return_exceptions=True
+                )
+
+                games = []
+                for game_count, result in enumerate(results, start=1):
+                    if isinstance(result, BaseException):
+                        logger.error(f"Failed to parse game {game_count}: {result}")
+                        errors.append(f"Game {game_count}: {result}")
+                    else:
+                        games.append(result)
 
             return PGNImportResult(
                 success=len(games) > 0,
@@ -123,51 +400,68 @@ class PGNService:
             )
 
     @staticmethod
-    def _parse_single_game(game: chess.pgn.Game) -> ParsedGame:
+    def _parse_single_game(
+        game: chess.pgn.Game,
+        want_san: bool = False,
+        raw_pgn: Optional[str] = None
+    ) -> ParsedGame:
         """
         Parse a single game object from python-chess
 
         Args:
             game: chess.pgn.Game object
+            want_san: Also compute SAN moves (roughly doubles parse
+                cost; skipped by default since imports store UCI)
+            raw_pgn: Original PGN slice for this game, if the caller
+                has it; skips re-exporting the game tree (which walks
+                every move through SAN generation a second time)
 
         Returns:
             ParsedGame with extracted data
         """
-        # Extract metadata from headers
+        # Extract metadata from headers in one pass over the static
+        # tag table instead of thirteen individual .get calls
         headers = game.headers
-        metadata = GameMetadata(
-            event=headers.get("Event"),
-            site=headers.get("Site"),
-            date=headers.get("Date"),
-            round=headers.get("Round"),
-            white=headers.get("White"),
-            black=headers.get("Black"),
-            result=headers.get("Result"),
-            white_elo=PGNService._parse_elo(headers.get("WhiteElo")),
-            black_elo=PGNService._parse_elo(headers.get("BlackElo")),
-            eco=headers.get("ECO"),
-            opening=headers.get("Opening"),
-            time_control=headers.get("TimeControl"),
-            termination=headers.get("Termination")
-        )
+        meta_kwargs = {
+            field: headers[tag] for tag, field in _META_FIELDS if tag in headers
+        }
+        meta_kwargs["white_elo"] = PGNService._parse_elo(headers.get("WhiteElo"))
+        meta_kwargs["black_elo"] = PGNService._parse_elo(headers.get("BlackElo"))
+        metadata = GameMetadata(**meta_kwargs)
 
         # Extract moves
         board = game.board()
-        fen_start = board.fen()
-
-        moves_uci: List[str] = []
-        moves_san: List[str] = []
-
-        for move in game.mainline_moves():
-            moves_san.append(board.san(move))
-            moves_uci.append(move.uci())
+        # Games without a setup header always start from the standard
+        # position, so reuse the constant instead of serializing it
+        fen_start = board.fen() if "FEN" in headers else chess.STARTING_FEN
+
+        moves_list = list(game.mainline_moves())
+        moves_uci: List[str] = [move.uci() for move in moves_list]
+
+        moves_san: Optional[List[str]] = None
+        if want_san:
+            # One walk of the whole line beats per-ply board.san calls,
+            # which each regenerate the legal-move list from Python.
+            # Black-to-move setups fuse the number onto the first SAN
+            # ("1...e5"), so strip prefixes rather than dropping every
+            # token containing a dot.
+            moves_san = []
+            for token in board.variation_san(moves_list).split():
+                san = _SAN_NUM_PREFIX.sub("", token)
+                if san:
+                    moves_san.append(san)
+
+        for move in moves_list:
             board.push(move)
 
         fen_final = board.fen()
 
-        # Get PGN text
-        exporter = chess.pgn.StringExporter(headers=True, variations=False, comments=False)
-        pgn_text = game.accept(exporter)
+        # Reuse the caller-supplied raw slice when available; only
+        # re-render through the exporter when parsing from a stream
+        if raw_pgn is not None:
+            pgn_text = raw_pgn.strip()
+        else:
+            pgn_text = game.accept(_get_exporter())
 
         return ParsedGame(
             metadata=metadata,
@@ -182,12 +476,7 @@ class PGNService:
     @staticmethod
     def _parse_elo(elo_str: Optional[str]) -> Optional[int]:
         """Parse ELO rating from string"""
-        if not elo_str or elo_str == "?":
-            return None
-        try:
-            return int(elo_str)
-        except (ValueError, TypeError):
-            return None
+        return _parse_elo_cached(elo_str)
 
     @staticmethod
     def validate_pgn(pgn_text: str) -> tuple[bool, Optional[str]]:
@@ -201,18 +490,17 @@ class PGNService:
             Tuple of (is_valid, error_message)
         """
         try:
-            pgn_io = io.StringIO(pgn_text)
-            game = chess.pgn.read_game(pgn_io)
+            game = chess.pgn.read_game(_open_pgn(pgn_text))
 
             if game is None:
                 return False, "No valid game found in PGN"
 
-            # Try to replay the game to validate moves
-            board = game.board()
-            for move in game.mainline_moves():
-                if move not in board.legal_moves:
-                    return False, f"Illegal move: {move}"
-                board.push(move)
+            # read_game already replayed every move against the board
+            # while parsing and collected any illegal/unparseable moves
+            # in game.errors, so a second replay with per-ply
+            # legal-move scans would just repeat that work
+            if game.errors:
+                return False, str(game.errors[0])
 
             return True, None
 
@@ -254,27 +542,38 @@ class PGNService:
 
         for move_uci in moves:
             try:
-                move = chess.Move.from_uci(move_uci)
-                if move in board.legal_moves:
-                    node = node.add_variation(move)
+                try:
+                    move = _fast_uci(move_uci)
+                except KeyError:
+                    move = chess.Move.from_uci(move_uci)
+                # is_legal is a bitboard check, not a legal-move
+                # enumeration, so validate+apply stays one cheap pass
+                if board.is_legal(move):
                     board.push(move)
+                    node = node.add_variation(move)
                 else:
                     logger.warning(f"Skipping illegal move: {move_uci}")
-            except Exception as e:
-                logger.warning(f"Invalid move format: {move_uci}: {e}")
+            except ValueError as e:
+                logger.warning(f"Skipping invalid move: {move_uci}: {e}")
 
-        # Export to string
-        exporter = chess.pgn.StringExporter(headers=True, variations=False, comments=False)
-        return game.accept(exporter)
+        # Export to string on the reusable per-thread exporter
+        return game.accept(_get_exporter())
 
     @staticmethod
-    def extract_opening_info(moves: List[str], max_moves: int = 15) -> Dict[str, Any]:
+    def extract_opening_info(
+        moves: List[str],
+        max_moves: int = 15,
+        trusted: bool = False
+    ) -> Dict[str, Any]:
         """
         Extract opening information from game moves
 
         Args:
             moves: List of moves in UCI format
             max_moves: Number of moves to analyze for opening
+            trusted: Moves are already validated (e.g. ParsedGame.moves
+                or a decoded moves_binary blob); skips the per-ply
+                legality check
 
         Returns:
             Dictionary with opening info (eco code, name, etc.)
@@ -286,16 +585,23 @@ class PGNService:
         board = chess.Board()
         opening_moves = []
 
-        for move_uci in moves[:max_moves]:
-            try:
-                move = chess.Move.from_uci(move_uci)
-                if move in board.legal_moves:
-                    opening_moves.append(board.san(move))
-                    board.push(move)
-                else:
+        if trusted:
+            for move_uci in moves[:max_moves]:
+                try:
+                    move = _fast_uci(move_uci)
+                except KeyError:
+                    move = chess.Move.from_uci(move_uci)
+                opening_moves.append(board.san_and_push(move))
+        else:
+            for move_uci in moves[:max_moves]:
+                try:
+                    # parse_uci validates legality in one pass;
+                    # san_and_push fuses SAN disambiguation with
+                    # applying the move
+                    move = board.parse_uci(move_uci)
+                    opening_moves.append(board.san_and_push(move))
+                except ValueError:
                     break
-            except:
-                break
 
         return {
             "moves": opening_moves,
@@ -0,0 +1,31 @@
+"""Add composite index on games(user_id, created_at DESC)
+
+Revision ID: 3f8a1c5d9b42
+Revises: 7c37d7936066
+Create Date: 2026-08-27 10:12:44.102938
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a1c5d9b42'
+down_revision: Union[str, None] = '7c37d7936066'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_games_user_created',
+        'games',
+        ['user_id', sa.text('created_at DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_games_user_created', table_name='games')
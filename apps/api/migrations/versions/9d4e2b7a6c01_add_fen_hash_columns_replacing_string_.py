@@ -0,0 +1,59 @@
+"""Add fen_hash columns replacing String fen indexes
+
+Revision ID: 9d4e2b7a6c01
+Revises: 3f8a1c5d9b42
+Create Date: 2026-08-27 10:41:17.559204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import xxhash
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4e2b7a6c01'
+down_revision: Union[str, None] = '3f8a1c5d9b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _fen_hash(fen: str) -> int:
+    # Keep in sync with app.database.models.fen_hash
+    return xxhash.xxh64_intdigest(fen.encode("ascii")) & 0x7FFFFFFFFFFFFFFF
+
+
+def _backfill(table: str) -> None:
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(f"SELECT id, fen FROM {table}")).all()
+    for row_id, fen in rows:
+        bind.execute(
+            sa.text(f"UPDATE {table} SET fen_hash = :h WHERE id = :id"),
+            {"h": _fen_hash(fen), "id": row_id},
+        )
+
+
+def upgrade() -> None:
+    op.add_column('positions', sa.Column('fen_hash', sa.BigInteger(), nullable=True))
+    op.add_column('explanation_cache', sa.Column('fen_hash', sa.BigInteger(), nullable=True))
+
+    _backfill('positions')
+    _backfill('explanation_cache')
+
+    op.create_index(op.f('ix_positions_fen_hash'), 'positions', ['fen_hash'], unique=False)
+    op.create_index(op.f('ix_explanation_cache_fen_hash'), 'explanation_cache', ['fen_hash'], unique=False)
+
+    op.drop_index(op.f('ix_positions_fen'), table_name='positions')
+    op.drop_index(op.f('ix_explanation_cache_fen'), table_name='explanation_cache')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_explanation_cache_fen'), 'explanation_cache', ['fen'], unique=False)
+    op.create_index(op.f('ix_positions_fen'), 'positions', ['fen'], unique=False)
+
+    op.drop_index(op.f('ix_explanation_cache_fen_hash'), table_name='explanation_cache')
+    op.drop_index(op.f('ix_positions_fen_hash'), table_name='positions')
+
+    op.drop_column('explanation_cache', 'fen_hash')
+    op.drop_column('positions', 'fen_hash')
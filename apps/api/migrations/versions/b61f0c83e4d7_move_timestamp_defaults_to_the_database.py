@@ -0,0 +1,36 @@
+"""Move timestamp defaults to the database
+
+Revision ID: b61f0c83e4d7
+Revises: 9d4e2b7a6c01
+Create Date: 2026-08-27 11:02:31.884610
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b61f0c83e4d7'
+down_revision: Union[str, None] = '9d4e2b7a6c01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TIMESTAMP_COLUMNS = (
+    ('users', 'created_at'),
+    ('games', 'created_at'),
+    ('games', 'updated_at'),
+    ('positions', 'created_at'),
+    ('explanation_cache', 'created_at'),
+)
+
+
+def upgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
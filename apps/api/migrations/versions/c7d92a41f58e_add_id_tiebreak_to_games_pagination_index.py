@@ -0,0 +1,42 @@
+"""Add id tiebreak to the games pagination index
+
+Revision ID: c7d92a41f58e
+Revises: b61f0c83e4d7
+Create Date: 2026-08-27 18:40:21.553176
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d92a41f58e'
+down_revision: Union[str, None] = 'b61f0c83e4d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination now orders by (created_at, id) per user so that
+    # created_at ties (bulk imports commit whole batches under one
+    # server-side timestamp) page deterministically; the index must
+    # match that ordering
+    op.drop_index('ix_games_user_created', table_name='games')
+    op.create_index(
+        'ix_games_user_created',
+        'games',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_games_user_created', table_name='games')
+    op.create_index(
+        'ix_games_user_created',
+        'games',
+        ['user_id', sa.text('created_at DESC')],
+        unique=False,
+    )
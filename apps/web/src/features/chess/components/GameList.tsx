@@ -4,22 +4,26 @@ import React from 'react';
 import { useQuery, gql } from '@apollo/client';
 
 const GET_GAMES_QUERY = gql`
-  query GetGames($userId: Int!, $limit: Int, $offset: Int) {
-    games(userId: $userId, limit: $limit, offset: $offset) {
-      id
-      whitePlayer
-      blackPlayer
-      whiteElo
-      blackElo
-      result
-      event
-      site
-      ecoCode
-      openingName
-      moveCount
-      datePlayed
-      createdAt
-      source
+  query GetGames($userId: Int!, $limit: Int, $after: DateTime, $afterId: Int) {
+    games(userId: $userId, limit: $limit, after: $after, afterId: $afterId) {
+      games {
+        id
+        whitePlayer
+        blackPlayer
+        whiteElo
+        blackElo
+        result
+        event
+        site
+        ecoCode
+        openingName
+        moveCount
+        datePlayed
+        createdAt
+        source
+      }
+      nextCursor
+      nextCursorId
     }
   }
 `;
@@ -41,17 +45,23 @@ interface Game {
   source: string;
 }
 
+interface GameConnection {
+  games: Game[];
+  nextCursor?: string | null;
+  nextCursorId?: number | null;
+}
+
 interface GameListProps {
   userId: number;
   onGameSelect?: (gameId: number) => void;
 }
 
 export const GameList: React.FC<GameListProps> = ({ userId, onGameSelect }) => {
-  const { data, loading, error, refetch } = useQuery(GET_GAMES_QUERY, {
-    variables: { userId, limit: 50, offset: 0 },
+  const { data, loading, error, refetch, fetchMore } = useQuery(GET_GAMES_QUERY, {
+    variables: { userId, limit: 50 },
   });
 
-  if (loading) {
+  if (loading && !data) {
     return (
       <div className="flex justify-center items-center p-8">
         <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-blue-600"></div>
@@ -76,7 +86,23 @@ export const GameList: React.FC<GameListProps> = ({ userId, onGameSelect }) => {
     );
   }
 
-  const games: Game[] = data?.games || [];
+  const connection: GameConnection | undefined = data?.games;
+  const games: Game[] = connection?.games || [];
+
+  // Keyset cursor for the next page; null once the library is exhausted
+  const nextCursor = connection?.nextCursor ?? null;
+  const nextCursorId = connection?.nextCursorId ?? null;
+
+  const loadMore = () =>
+    fetchMore({
+      variables: { after: nextCursor, afterId: nextCursorId },
+      updateQuery: (prev, { fetchMoreResult }) => ({
+        games: {
+          ...fetchMoreResult.games,
+          games: [...prev.games.games, ...fetchMoreResult.games.games],
+        },
+      }),
+    });
 
   if (games.length === 0) {
     return (
@@ -219,6 +245,18 @@ export const GameList: React.FC<GameListProps> = ({ userId, onGameSelect }) => {
           </a>
         ))}
       </div>
+
+      {/* Load More */}
+      {nextCursor && (
+        <div className="text-center">
+          <button
+            onClick={() => loadMore()}
+            className="px-6 py-2 bg-gray-200 dark:bg-gray-700 hover:bg-gray-300 dark:hover:bg-gray-600 text-gray-800 dark:text-gray-200 rounded-md text-sm font-medium transition-colors"
+          >
+            Load More
+          </button>
+        </div>
+      )}
     </div>
   );
 };